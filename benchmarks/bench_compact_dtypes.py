@@ -0,0 +1,129 @@
+"""
+Benchmark the memory used by extraction stages 2 and 3 with compact dtypes and the intermediate
+amount columns dropped against the previous frame, of object columns holding every intermediate
+list column.
+
+Interests are sampled from the test fixture and spread across synthetic members to build a frame
+of the requested size, with every string copied so rows don't share string objects, as when a raw
+file is parsed. Each variant runs in a fresh process, so its peak RSS can be compared; RSS is used
+rather than tracemalloc, which doesn't see the memory Arrow allocates. The frames are checked to
+hold the same values before memory is reported.
+
+Usage (from the project root):
+    python benchmarks/bench_compact_dtypes.py --rows 100000
+"""
+
+import argparse
+import contextlib
+import io
+import multiprocessing
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+from members_interest_app.utils.bootstrap import setup_django  # noqa: E402
+
+setup_django()
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+from bench_run_extraction_stages import build_frame  # noqa: E402
+
+from members_interest_app.utils import (  # noqa: E402
+    unpack_and_save_registered_interests as unpack,
+)
+from members_interest_app.utils.compact_dtypes import frame_memory_mb  # noqa: E402
+from members_interest_app.utils.pipeline_profiler import peak_rss_kb  # noqa: E402
+
+
+def copy_strings(df):
+    "Give every row its own copy of each string value, as parsing a raw file does. Returns dataframe."
+    for column in df.select_dtypes(include="object").columns:
+        df[column] = [
+            value.encode("utf-8").decode("utf-8") if isinstance(value, str) else value
+            for value in df[column]
+        ]
+    return df
+
+
+def legacy_extraction_stages(df):
+    "Stages 2 and 3 as they were before, keeping the amount strings and split amounts in the frame."
+    df = unpack.flag_time_periods_and_debt(df)
+
+    data = df.loc[
+        df["category_name"].isin(unpack.EXTRACTABLE_AMOUNT_CATEGORIES), ["interest"]
+    ].copy()
+    data = unpack.remove_space_in_registration_numbers(data)
+    data = unpack.convert_abbreviated_numbers_to_numbers(data, "edited_interest")
+    data["extracted_amounts"] = data["edited_interest"].apply(
+        lambda x: re.findall(unpack.EXTRACT_MONEY_PATTERN, x)
+    )
+    data["filtered_amounts"] = data["extracted_amounts"].apply(unpack.filter_currency)
+    data["has_multiple_fullstops"] = data["filtered_amounts"].apply(
+        unpack.has_multiple_fullstops
+    )
+    data = unpack.filter_multiple_fullstops(data)
+    data = unpack.extract_max_amount_with_currency(data, "filtered_amounts")
+    df = unpack.add_columns_by_index(df, data)
+
+    return unpack.extract_third_party_details(df)
+
+
+def run_variant(rows, compact):
+    "Build the frame and run stages 2 and 3 in this process. Run in a fresh worker process."
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        if compact:
+            # build_frame replaces the member and interest ids, so they're compacted again
+            df = unpack.compact_interest_dtypes(copy_strings(build_frame(rows)))
+            df = unpack.compact_interest_dtypes(unpack.run_extraction_stages(df))
+        else:
+            with patch.object(unpack, "COMPACT_INTEREST_DTYPES", {}):
+                df = legacy_extraction_stages(copy_strings(build_frame(rows)))
+    seconds = time.perf_counter() - start
+    return df, seconds, frame_memory_mb(df), peak_rss_kb()
+
+
+def in_fresh_process(rows, compact):
+    # a process's peak RSS carries over from the process it was forked from, so workers are
+    # forked from a server started before this process holds any frames
+    context = multiprocessing.get_context("forkserver")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(run_variant, rows, compact).result()
+
+
+def as_values(df):
+    "The frame's values as objects, missing values as NaN, for comparing frames of different dtypes."
+    values = df.astype(object)
+    return values.where(df.notna(), np.nan)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    legacy, legacy_time, legacy_mb, legacy_rss = in_fresh_process(args.rows, False)
+    compact, compact_time, compact_mb, compact_rss = in_fresh_process(args.rows, True)
+
+    pd.testing.assert_frame_equal(
+        as_values(compact), as_values(legacy[compact.columns])
+    )
+
+    print(f"{args.rows} rows, stages 2 and 3, extracted frame size and peak RSS")
+    print(
+        f"  object dtypes, lists kept: {legacy_time:.2f}s, {legacy_mb:.0f}MB, {legacy_rss / 1024:.0f} MiB"
+    )
+    print(
+        f"  compact dtypes:            {compact_time:.2f}s, {compact_mb:.0f}MB, {compact_rss / 1024:.0f} MiB"
+    )
+
+
+if __name__ == "__main__":
+    main()
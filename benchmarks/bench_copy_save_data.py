@@ -0,0 +1,103 @@
+"""
+Benchmark saving prepared registered interests with PostgreSQL COPY (copy_save_data) against
+the ORM path (bulk_save_data).
+
+Runs against the database in the project settings, which must be PostgreSQL. Interests are
+sampled from the test fixture and spread across synthetic members, which are created for the run.
+Everything the benchmark saves is deleted again afterwards.
+
+Usage (from the project root):
+    python benchmarks/bench_copy_save_data.py --rows 100000
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+from members_interest_app.utils.bootstrap import setup_django  # noqa: E402
+
+setup_django()
+
+from bench_run_extraction_stages import build_frame  # noqa: E402
+from django.db import connection  # noqa: E402
+
+from members_interest_app.models import (  # noqa: E402
+    MemberOfParliament,
+    RegisteredInterest,
+)
+from members_interest_app.utils import (  # noqa: E402
+    unpack_and_save_registered_interests as unpack,
+)
+
+MEMBER_PREFIX = "bench-"
+
+
+def prepared_frame(rows):
+    df = build_frame(rows)
+    df["member_id"] = MEMBER_PREFIX + df["member_id"]
+    df["unique_interest_id"] = MEMBER_PREFIX + df["unique_interest_id"]
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        df = unpack.run_extraction_stages(df)
+        return unpack.prepare_for_database(df, adjust_types="y")
+
+
+def clear_saved():
+    RegisteredInterest.objects.filter(
+        unique_api_generated_id__startswith=MEMBER_PREFIX
+    ).delete()
+
+
+def time_it(save, df, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        clear_saved()
+        start = time.perf_counter()
+        saved = save(df.copy())
+        best = min(best, time.perf_counter() - start)
+        if saved != len(df):
+            raise RuntimeError(
+                f"{save.__name__} saved {saved} of {len(df)} rows, see errors.csv"
+            )
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    if connection.vendor != "postgresql":
+        sys.exit(
+            f"COPY needs PostgreSQL, the configured database is {connection.vendor}."
+        )
+
+    df = prepared_frame(args.rows)
+    member_ids = df["member_of_parliament"].unique()
+    MemberOfParliament.objects.bulk_create(
+        [MemberOfParliament(api_id=api_id, name=api_id) for api_id in member_ids],
+        ignore_conflicts=True,
+    )
+
+    try:
+        orm = time_it(unpack.bulk_save_data, df, args.repeats)
+        copy = time_it(unpack.copy_save_data, df, args.repeats)
+    finally:
+        clear_saved()
+        MemberOfParliament.objects.filter(api_id__startswith=MEMBER_PREFIX).delete()
+
+    print(f"rows: {len(df)}")
+    print(f"bulk_save_data: {orm:.2f}s ({len(df) / orm:,.0f} rows/s)")
+    print(f"copy_save_data: {copy:.2f}s ({len(df) / copy:,.0f} rows/s)")
+    print(f"speedup: {orm / copy:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Benchmark vectorised amount and currency extraction against the previous per-row apply implementation.
+
+A synthetic frame of the requested size is built from lists of typical filtered amount strings.
+The two implementations' outputs are checked to be identical before timing.
+
+Usage (from the project root):
+    python benchmarks/bench_extract_max_amount.py --rows 100000
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+from members_interest_app.utils.bootstrap import setup_django  # noqa: E402
+
+setup_django()
+
+import pandas as pd  # noqa: E402
+
+from members_interest_app.utils import (  # noqa: E402
+    unpack_and_save_registered_interests as unpack,
+)
+
+AMOUNT_STRINGS = [
+    "£1,200",
+    "£250000",
+    "£1200000",
+    "£95.50",
+    "$3,000",
+    "$50.00 USD",
+    "€400",
+    "EUR 2,500",
+    "GBP 1,000",
+    "AUD 750",
+    "1,500 GBP",
+    "£10,000 EUR",
+    "2.50",
+]
+
+
+def legacy_extract_max_amount_with_currency(dataframe, column_name):
+    "extract_max_amount_with_currency as it was before vectorising: one pd.Series built per row."
+    currency_choice_map = unpack.CURRENCY_CHOICE_MAP
+    amounts_pattern = re.compile(r"(\d+(?:,\d{3})*(?:\.\d+)?)")
+    currencies_pattern = re.compile(r"(AUD|USD|GBP|EUR|£|\$|€)")
+
+    def process_entry(entry_list):
+        amount_currency_tuples = []
+        for entry in entry_list:
+            if not entry:
+                continue
+            amounts = amounts_pattern.findall(entry)
+            currencies = currencies_pattern.findall(entry)
+            for i, amount in enumerate(amounts):
+                clean_amount = float(amount.replace(",", ""))
+                currency = (
+                    currency_choice_map.get(currencies[i])
+                    if i < len(currencies)
+                    else None
+                )
+                amount_currency_tuples.append((clean_amount, currency))
+
+        if amount_currency_tuples:
+            max_amount, max_currency = max(amount_currency_tuples, key=lambda x: x[0])
+        else:
+            max_amount, max_currency = None, None
+
+        split_amounts = [t[0] for t in amount_currency_tuples]
+        split_currencies = [t[1] for t in amount_currency_tuples]
+        return split_amounts, split_currencies, max_amount, max_currency
+
+    dataframe[
+        ["split_amounts", "split_currencies", "max_amount", "max_amount_currency"]
+    ] = dataframe[column_name].apply(lambda x: pd.Series(process_entry(x)))
+    return dataframe
+
+
+def build_frame(rows):
+    rng = random.Random(0)
+    return pd.DataFrame(
+        {
+            "filtered_amounts": [
+                rng.sample(AMOUNT_STRINGS, rng.choice([0, 1, 1, 1, 2, 3]))
+                for _ in range(rows)
+            ]
+        }
+    )
+
+
+def time_it(func, df, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        frame = df.copy()
+        start = time.perf_counter()
+        func(frame, "filtered_amounts")
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    df = build_frame(args.rows)
+
+    pd.testing.assert_frame_equal(
+        unpack.extract_max_amount_with_currency(df.copy(), "filtered_amounts"),
+        legacy_extract_max_amount_with_currency(df.copy(), "filtered_amounts"),
+    )
+
+    legacy = time_it(legacy_extract_max_amount_with_currency, df, args.repeats)
+    vectorised = time_it(unpack.extract_max_amount_with_currency, df, args.repeats)
+
+    print(f"{args.rows} rows, best of {args.repeats}")
+    print(f"  apply:      {legacy:.3f}s")
+    print(f"  vectorised: {vectorised:.3f}s ({legacy / vectorised:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Benchmark single-pass payer detail extraction against the previous four-pass implementation.
+
+Interests are sampled from the test fixture to build a frame of the requested size.
+The two implementations' outputs are checked to be identical before timing.
+
+Usage (from the project root):
+    python benchmarks/bench_extract_payer_details.py --rows 100000
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+from members_interest_app.utils.bootstrap import setup_django  # noqa: E402
+
+setup_django()
+
+import pandas as pd  # noqa: E402
+
+from members_interest_app.utils import (  # noqa: E402
+    unpack_and_save_registered_interests as unpack,
+)
+
+FIXTURE_PATH = os.path.join(
+    ROOT_DIR,
+    "members_interest_app",
+    "tests",
+    "fixtures",
+    "registered_interests_sample.json",
+)
+
+
+def legacy_extract_payer_details(df):
+    "extract_payer_details as it was before the single-pass version: four apply passes, two searches each."
+    donor_name_pattern = r"(?<!Address of )(?:donor|payer):\s?([\w\s,]+)(?=\r\n|$)"
+    donor_type_pattern = r"Donor status:\s(\w+(?:\s\w+)*)(?=\r?\n|$)"
+    donor_address_pattern = r"Address of donor:\s?([^\r\n\.]*)(?=[\r\n\.])"
+    companies_house_id_pattern = r"(?:registration)\s+(\d+)"
+
+    df["donor_name"] = df["interest"].apply(
+        lambda x: re.search(donor_name_pattern, x).group(1)
+        if re.search(donor_name_pattern, x)
+        else None
+    )
+    df["donor_type"] = df["interest"].apply(
+        lambda x: re.search(donor_type_pattern, x).group(1)
+        if re.search(donor_type_pattern, x)
+        else None
+    )
+    df["donor_address"] = df["interest"].apply(
+        lambda x: re.search(donor_address_pattern, x).group(1)
+        if re.search(donor_address_pattern, x)
+        else None
+    )
+    df["companies_house_id"] = df["interest"].apply(
+        lambda x: re.search(companies_house_id_pattern, x).group(1)
+        if re.search(companies_house_id_pattern, x)
+        else None
+    )
+    return df
+
+
+def build_frame(rows):
+    sample = unpack.extract_preprocess_interest_data(FIXTURE_PATH)
+    return sample.sample(n=rows, replace=True, random_state=0).reset_index(drop=True)
+
+
+def time_it(func, df, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        frame = df.copy()
+        start = time.perf_counter()
+        func(frame)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    df = build_frame(args.rows)
+
+    pd.testing.assert_frame_equal(
+        unpack.extract_payer_details(df.copy()), legacy_extract_payer_details(df.copy())
+    )
+
+    legacy = time_it(legacy_extract_payer_details, df, args.repeats)
+    single_pass = time_it(unpack.extract_payer_details, df, args.repeats)
+
+    print(f"{args.rows} rows, best of {args.repeats}")
+    print(f"  four-pass:   {legacy:.3f}s")
+    print(f"  single-pass: {single_pass:.3f}s ({legacy / single_pass:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
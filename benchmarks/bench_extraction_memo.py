@@ -0,0 +1,97 @@
+"""
+Benchmark extraction stages 2 and 3 with the extraction memo (memoised_extraction_stages) against
+running them on every interest (run_extraction_stages).
+
+Interests are sampled from the test fixture and spread across synthetic members to build a frame
+of the requested size, each given a different ending so no two texts are the same. The memo is
+timed empty, then on a copy of the frame with a share of its texts changed, as in a later
+snapshot. Outputs are checked to be identical to running the stages before timing is reported.
+
+Usage (from the project root):
+    python benchmarks/bench_extraction_memo.py --rows 100000 --changed 0.02
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+from members_interest_app.utils.bootstrap import setup_django  # noqa: E402
+
+setup_django()
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+from bench_run_extraction_stages import build_frame  # noqa: E402
+
+from members_interest_app.utils import (  # noqa: E402
+    unpack_and_save_registered_interests as unpack,
+)
+from members_interest_app.utils.extraction_memo import ExtractionMemo  # noqa: E402
+
+
+def text_ending(i):
+    "A word made of letters only, different for every i, so amounts extracted are unchanged."
+    letters = []
+    while True:
+        i, letter = divmod(i, 26)
+        letters.append(chr(ord("a") + letter))
+        if not i:
+            return " Ref " + "".join(letters) + "."
+
+
+def timed(func):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = func()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--changed", type=float, default=0.02)
+    args = parser.parse_args()
+
+    df = build_frame(args.rows)
+    df["interest"] = df["interest"] + [text_ending(i) for i in range(len(df))]
+
+    later = df.copy()
+    changed = np.random.default_rng(0).random(len(later)) < args.changed
+    later.loc[changed, "interest"] = later.loc[changed, "interest"] + " Amended."
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        memo_path = os.path.join(tmp_dir, "extraction_memo.sqlite3")
+
+        expected, stages = timed(lambda: unpack.run_extraction_stages(df.copy()))
+        with ExtractionMemo(memo_path, unpack.EXTRACTION_CACHE_VERSION) as memo:
+            empty, empty_seconds = timed(
+                lambda: unpack.memoised_extraction_stages(df.copy(), memo)
+            )
+        memo_size = os.path.getsize(memo_path)
+
+        expected_later = unpack.run_extraction_stages(later.copy())
+        with ExtractionMemo(memo_path, unpack.EXTRACTION_CACHE_VERSION) as memo:
+            memoised, memoised_seconds = timed(
+                lambda: unpack.memoised_extraction_stages(later.copy(), memo)
+            )
+
+    pd.testing.assert_frame_equal(empty, expected)
+    pd.testing.assert_frame_equal(memoised, expected_later)
+
+    print(f"rows: {len(df)}, changed texts: {changed.sum()}")
+    print(f"stages:                {stages:.2f}s")
+    print(f"memo, empty:           {empty_seconds:.2f}s")
+    print(f"memo, changed texts:   {memoised_seconds:.2f}s")
+    print(f"speedup on later run:  {stages / memoised_seconds:.1f}x")
+    print(f"memo size: {memo_size / 1e6:.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Benchmark extraction stages 2 and 3 composed by writing columns into one frame against the
+previous composition, which copied slices of the frame and merged them back on unique_interest_id.
+
+Interests are sampled from the test fixture and spread across synthetic members to build a frame
+of the requested size. The outputs are checked to be identical before timing, and peak memory
+allocated during each run is measured with tracemalloc.
+
+Usage (from the project root):
+    python benchmarks/bench_extraction_stages_memory.py --rows 100000
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import re
+import sys
+import time
+import tracemalloc
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+from members_interest_app.utils.bootstrap import setup_django  # noqa: E402
+
+setup_django()
+
+import pandas as pd  # noqa: E402
+from bench_run_extraction_stages import build_frame  # noqa: E402
+
+from members_interest_app.utils import (  # noqa: E402
+    unpack_and_save_registered_interests as unpack,
+)
+
+
+def legacy_extract_family_member_info(df):
+    "extract_family_member_info as it was before: a filtered copy of the whole frame with the new columns."
+    family_categories = [
+        "10. Family members engaged in lobbying the public sector on behalf of a third party or client",
+        "9. Family members employed and paid from parliamentary expenses",
+    ]
+    filtered_df = df[df["category_name"].isin(family_categories)].copy()
+
+    for column, pattern in [
+        ("family_member_name", r"Name:\s*(.*?)\r"),
+        ("family_member_relationship", r"Relationship:\s*(.*?)\r"),
+        ("family_member_role", r"Role:\s*(.*?)\r"),
+    ]:
+        filtered_df[column] = filtered_df["interest"].apply(
+            lambda x: re.search(pattern, x).group(1) if re.search(pattern, x) else None
+        )
+
+    for column in ["family_member_paid_by_mp_or_parliament", "family_member_lobbies"]:
+        filtered_df[column] = False
+        filtered_df.loc[
+            filtered_df["category_name"]
+            == "9. Family members employed and paid from parliamentary expenses",
+            column,
+        ] = True
+
+    return filtered_df
+
+
+def legacy_run_extraction_stages(df):
+    "Stages 2 and 3 as they were before: slices copied, then merged back on unique_interest_id."
+    df = unpack.mentions_time_period_or_preposition(df, "interest")
+    df = unpack.mentions_debt_synonyms(df, "interest")
+
+    data = df[df["category_name"].isin(unpack.EXTRACTABLE_AMOUNT_CATEGORIES)].copy()
+    data = unpack.remove_space_in_registration_numbers(data)
+    data = unpack.convert_abbreviated_numbers_to_numbers(data, "edited_interest")
+    data["extracted_amounts"] = data["edited_interest"].apply(
+        lambda x: re.findall(unpack.EXTRACT_MONEY_PATTERN, x)
+    )
+    data["filtered_amounts"] = data["extracted_amounts"].apply(unpack.filter_currency)
+    data["has_multiple_fullstops"] = data["filtered_amounts"].apply(
+        unpack.has_multiple_fullstops
+    )
+    data = unpack.filter_multiple_fullstops(data)
+    data = unpack.extract_max_amount_with_currency(data, "filtered_amounts")
+    merge_cols = [col for col in data.columns if col not in df.columns]
+    df = df.merge(
+        data[merge_cols + ["unique_interest_id"]], on="unique_interest_id", how="left"
+    )
+
+    data = unpack.extract_payer_details(df)
+    data = legacy_extract_family_member_info(data)
+    merge_cols = [col for col in data.columns if col not in df.columns]
+    df = df.merge(
+        data[merge_cols + ["unique_interest_id"]], on="unique_interest_id", how="left"
+    )
+    return unpack.extract_mp_role_and_employer(df)
+
+
+def measure(func, df, repeats):
+    best = float("inf")
+    peak = 0
+    for _ in range(repeats):
+        frame = df.copy()
+        tracemalloc.start()
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            func(frame)
+        best = min(best, time.perf_counter() - start)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return best, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    df = build_frame(args.rows)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        expected = unpack.run_extraction_stages(df.copy())
+        # the legacy stages also kept the intermediate amount columns
+        pd.testing.assert_frame_equal(
+            expected, legacy_run_extraction_stages(df.copy())[expected.columns]
+        )
+
+    legacy_time, legacy_peak = measure(legacy_run_extraction_stages, df, args.repeats)
+    new_time, new_peak = measure(unpack.run_extraction_stages, df, args.repeats)
+
+    print(f"{args.rows} rows, best time and peak allocated memory of {args.repeats}")
+    print(f"  merges:      {legacy_time:.3f}s, {legacy_peak / 2**20:.0f} MiB")
+    print(f"  one frame:   {new_time:.3f}s, {new_peak / 2**20:.0f} MiB")
+
+
+if __name__ == "__main__":
+    main()
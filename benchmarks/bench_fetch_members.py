@@ -0,0 +1,69 @@
+"""
+Benchmark the serial and async members fetchers against a local stand-in of the Members API.
+
+Usage (from the project root):
+    python benchmarks/bench_fetch_members.py --members 300 --latency 0.02 --concurrency 8
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+from members_interest_app.tests.mock_parliament_api import (  # noqa: E402
+    MockParliamentAPI,
+)
+from members_interest_app.utils import call_members_api  # noqa: E402
+
+
+def run(mode, args):
+    members = {i: {"id": i} for i in range(1, args.members + 1)}
+
+    # fresh output file and id index per run, so no run skips ids another has seen
+    with tempfile.TemporaryDirectory() as tmp_dir, MockParliamentAPI(
+        members=members, latency=args.latency
+    ) as api:
+        start = time.perf_counter()
+        call_members_api.fetch_members_data(
+            mode=mode,
+            concurrency=args.concurrency,
+            requests_per_second=args.requests_per_second,
+            url=api.members_url,
+            file_path=os.path.join(tmp_dir, "members.ndjson"),
+            state_dir=tmp_dir,
+        )
+        elapsed = time.perf_counter() - start
+
+    print(
+        f"{mode:>6}: {api.total_requests} requests in {elapsed:.2f}s "
+        f"({api.total_requests / elapsed:.1f} req/s)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--members", type=int, default=300)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--requests_per_second", type=float, default=200)
+    parser.add_argument(
+        "--serial_batch_wait",
+        type=float,
+        default=0,
+        help="Pause between serial batches of 10 (the fetcher's own default is 5 seconds).",
+    )
+    parser.add_argument("--modes", nargs="+", default=["serial", "async", "paged"])
+    args = parser.parse_args()
+
+    call_members_api.INITIAL_WAIT = args.serial_batch_wait
+
+    for mode in args.modes:
+        run(mode, args)
+
+
+if __name__ == "__main__":
+    main()
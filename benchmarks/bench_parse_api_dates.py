@@ -0,0 +1,85 @@
+"""
+Benchmark parsing registered interest date columns with parse_api_dates against the previous
+per value dateutil parse (parse_and_format_dates) followed by making the dates aware in UTC.
+
+Dates are sampled from the test fixture's formats: naive, with fractional seconds, with a UTC
+offset and missing. Both give the same UTC timestamps, which is checked before timing.
+
+Usage (from the project root):
+    python benchmarks/bench_parse_api_dates.py --rows 100000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+from dateutil import parser  # noqa: E402
+
+from members_interest_app.utils.dates import parse_api_dates  # noqa: E402
+
+SAMPLE_DATES = [
+    "2024-01-15T10:23:45.123",
+    "2023-12-12T14:05:33.27",
+    "2024-02-20T00:00:00",
+    "2024-09-02T10:00:00+01:00",
+    None,
+]
+
+
+def legacy_parse_and_format_dates(value):
+    "The per value parse prepare_for_database did before."
+    try:
+        if pd.isna(value):
+            return None
+        return parser.parse(value).replace(microsecond=0)
+    except (ValueError, TypeError):
+        return np.nan
+
+
+def legacy_parse(values):
+    "The previous parse, then the conversion to UTC made before saving."
+    return pd.to_datetime(values.apply(legacy_parse_and_format_dates), utc=True)
+
+
+def time_it(func, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--rows", type=int, default=100_000)
+    arg_parser.add_argument("--repeats", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    values = pd.Series(
+        [SAMPLE_DATES[i] for i in rng.integers(len(SAMPLE_DATES), size=args.rows)],
+        dtype=object,
+    )
+
+    pd.testing.assert_series_equal(parse_api_dates(values), legacy_parse(values))
+
+    legacy = time_it(lambda: legacy_parse(values), args.repeats)
+    vectorised = time_it(lambda: parse_api_dates(values), args.repeats)
+
+    print(f"rows: {len(values)}")
+    print(f"dateutil per value: {legacy:.2f}s ({len(values) / legacy:,.0f} rows/s)")
+    print(
+        f"parse_api_dates:    {vectorised:.2f}s ({len(values) / vectorised:,.0f} rows/s)"
+    )
+    print(f"speedup: {legacy / vectorised:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Benchmark converting prepared registered interests to model field values a column at a time
+(iter_registered_interest_fields) against the previous row by row cleaning in bulk_save_data.
+
+Interests are sampled from the test fixture and spread across synthetic members to build a frame
+of the requested size. Both conversions build the RegisteredInterest instances bulk_save_data
+saves, without touching the database. Their field values are checked to be identical before timing.
+
+Usage (from the project root):
+    python benchmarks/bench_registered_interest_fields.py --rows 100000
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+from members_interest_app.utils.bootstrap import setup_django  # noqa: E402
+
+setup_django()
+
+import pandas as pd  # noqa: E402
+from bench_run_extraction_stages import build_frame  # noqa: E402
+from django.db.models.fields import CharField  # noqa: E402
+from django.utils import timezone  # noqa: E402
+
+from members_interest_app.models import (  # noqa: E402
+    MemberOfParliament,
+    RegisteredInterest,
+)
+from members_interest_app.utils import (  # noqa: E402
+    unpack_and_save_registered_interests as unpack,
+)
+
+
+def legacy_make_dates_aware(value):
+    "The per value date conversion bulk_save_data did before."
+    if value is not None and not pd.isna(value):
+        if timezone.is_naive(value):
+            return timezone.make_aware(value, timezone.utc)
+        return value.astimezone(timezone.utc)
+    return None
+
+
+def legacy_registered_interest_fields(tup, columns, members_dict):
+    "The per row cleaning bulk_save_data did before."
+    instance_data = {
+        field: getattr(tup, field) for field in columns if hasattr(tup, field)
+    }
+
+    cleaned_instance_data = {
+        key: None
+        if pd.isna(value)
+        and isinstance(RegisteredInterest._meta.get_field(key), CharField)
+        else value
+        for key, value in instance_data.items()
+    }
+
+    cleaned_instance_data["member_of_parliament"] = members_dict.get(
+        str(cleaned_instance_data["member_of_parliament"])
+    )
+
+    for date_field in ["date_created", "date_last_amended", "date_deleted"]:
+        cleaned_instance_data[date_field] = legacy_make_dates_aware(
+            cleaned_instance_data[date_field]
+        )
+
+    cleaned_instance_data["interest_amount"] = (
+        None
+        if pd.isna(cleaned_instance_data["interest_amount"])
+        else cleaned_instance_data["interest_amount"]
+    )
+
+    return cleaned_instance_data
+
+
+def legacy_instances(df, members_dict):
+    return [
+        RegisteredInterest(
+            **legacy_registered_interest_fields(tup, df.columns, members_dict)
+        )
+        for tup in df.itertuples(index=False, name="Row")
+    ]
+
+
+def column_wise_instances(df, member_api_ids):
+    return [
+        RegisteredInterest(**fields)
+        for fields in unpack.iter_registered_interest_fields(df, member_api_ids)
+    ]
+
+
+def field_values(instances):
+    attnames = [field.attname for field in RegisteredInterest._meta.fields]
+    return [
+        [getattr(instance, attname) for attname in attnames] for instance in instances
+    ]
+
+
+def time_it(func, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        df = unpack.prepare_for_database(
+            unpack.run_extraction_stages(build_frame(args.rows)), adjust_types="y"
+        )
+
+    # unsaved members, so no database is needed
+    api_ids = df["member_of_parliament"].astype(str).unique()
+    members_dict = {
+        api_id: MemberOfParliament(api_id=api_id, name=api_id) for api_id in api_ids
+    }
+    member_api_ids = pd.Index(api_ids, dtype=object)
+
+    if field_values(legacy_instances(df, members_dict)) != field_values(
+        column_wise_instances(df, member_api_ids)
+    ):
+        raise AssertionError("column-wise field values differ from row by row")
+
+    legacy = time_it(lambda: legacy_instances(df, members_dict), args.repeats)
+    column_wise = time_it(
+        lambda: column_wise_instances(df, member_api_ids), args.repeats
+    )
+
+    print(f"rows: {len(df)}")
+    print(f"row by row:  {legacy:.2f}s ({len(df) / legacy:,.0f} rows/s)")
+    print(f"column-wise: {column_wise:.2f}s ({len(df) / column_wise:,.0f} rows/s)")
+    print(f"speedup: {legacy / column_wise:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
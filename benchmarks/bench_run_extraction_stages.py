@@ -0,0 +1,89 @@
+"""
+Benchmark running extraction stages 2 and 3 in a process pool against running them serially.
+
+Interests are sampled from the test fixture and spread across synthetic members to build a frame
+of the requested size. The serial and parallel outputs are checked to be identical before timing.
+
+Usage (from the project root):
+    python benchmarks/bench_run_extraction_stages.py --rows 100000 --workers 4
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+from members_interest_app.utils.bootstrap import setup_django  # noqa: E402
+
+setup_django()
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from members_interest_app.utils import (  # noqa: E402
+    unpack_and_save_registered_interests as unpack,
+)
+
+FIXTURE_PATH = os.path.join(
+    ROOT_DIR,
+    "members_interest_app",
+    "tests",
+    "fixtures",
+    "registered_interests_sample.json",
+)
+
+
+def build_frame(rows, interests_per_member=25):
+    sample = unpack.extract_preprocess_interest_data(FIXTURE_PATH)
+    df = sample.sample(n=rows, replace=True, random_state=0).reset_index(drop=True)
+    df["member_id"] = (np.arange(rows) // interests_per_member).astype(str)
+    df["unique_interest_id"] = [
+        f"{member}-{i}" for i, member in enumerate(df["member_id"])
+    ]
+    # members' rows are not always next to each other in a raw file
+    return df.sample(frac=1, random_state=1).reset_index(drop=True)
+
+
+def time_it(df, workers, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        frame = df.copy()
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            unpack.run_extraction_stages(frame, workers=workers)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    df = build_frame(args.rows)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        pd.testing.assert_frame_equal(
+            unpack.run_extraction_stages(df.copy(), workers=args.workers),
+            unpack.run_extraction_stages(df.copy()),
+        )
+
+    serial = time_it(df, 1, args.repeats)
+    parallel = time_it(df, args.workers, args.repeats)
+
+    print(f"{args.rows} rows, best of {args.repeats}")
+    print(f"  serial:    {serial:.3f}s")
+    print(
+        f"  {args.workers} workers: {parallel:.3f}s ({serial / parallel:.1f}x faster)"
+    )
+
+
+if __name__ == "__main__":
+    main()